@@ -0,0 +1,220 @@
+"""
+Purpose:
+--------
+Time and record peak memory of each pipeline stage on synthetic panels of
+increasing size (markets x tenors x years), fully offline.
+
+This script generates:
+- results/benchmark_baseline.csv
+
+One row per (stage, size). Rerunning with --compare checks a fresh run
+against the saved baseline and flags stages that got slower or heavier.
+
+Adding a stage:
+- write a function taking the shared context dict
+- register it in STAGES (order matters: later stages can reuse ctx entries)
+
+Usage:
+    python -m src.benchmarks.run_benchmarks
+    python -m src.benchmarks.run_benchmarks --sizes 4x2x5 8x4x10 --compare
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+from src.benchmarks.synthetic import write_synthetic_raw
+from src.data.build_master import build_master_df
+from src.data.load_raw import RAW_FILES, _read_bbg_csv
+from src.diagnostics.render_diagnostics import render_diagnostics
+from src.diagnostics.seasonality import analyze_seasonality
+from src.diagnostics.stationarity import run_stationarity_suite
+from src.structure.pca import rolling_pc1, standardize
+
+OUT = Path("results/benchmark_baseline.csv")
+
+# markets x tenors x years
+SIZES = ["4x2x5", "8x4x10", "12x4x20"]
+REPEATS = 2
+SEED = 0
+
+PCA_WINDOW = 252
+
+# Flag a stage if it is this many times slower / heavier than the baseline
+TIME_TOLERANCE = 1.5
+MEM_TOLERANCE = 1.5
+
+
+def _yield_cols(df):
+    return [c for c in df.columns if c.startswith("bond_yields__")]
+
+
+def stage_read_bbg_csv(ctx):
+    return _read_bbg_csv(ctx["raw_dir"] / RAW_FILES["bond_yields"])
+
+
+def stage_build_master_df(ctx):
+    return build_master_df(ctx["raw_dir"])
+
+
+def stage_run_stationarity_suite(ctx):
+    # Same work as run_stationarity.main: levels and first differences
+    df = ctx["master"]
+    return run_stationarity_suite(df), run_stationarity_suite(df.diff())
+
+
+def stage_analyze_seasonality(ctx):
+    df_diff = ctx["master"][_yield_cols(ctx["master"])].diff()
+    return [analyze_seasonality(df_diff[c], name=c) for c in df_diff.columns]
+
+
+def stage_rolling_pca(ctx):
+    # One tenor across markets, as in NOTEBOOKS/05_pca_structure.ipynb
+    master = ctx["master"]
+    tenor = ctx["tenor"]
+    cols = [c for c in _yield_cols(master) if f"{tenor} Govt" in c]
+    X = standardize(master[cols].asfreq("B").diff().dropna(how="any"))
+    return rolling_pc1(X, window=PCA_WINDOW)
+
+
+def stage_render_diagnostics(ctx):
+    # Single process so the timing is per-core render cost
+    out_dir = ctx["raw_dir"].parent / "diagnostics"
+    return render_diagnostics(ctx["master"], out_dir=out_dir, fmt="png", workers=1)
+
+
+STAGES = {
+    "read_bbg_csv": stage_read_bbg_csv,
+    "build_master_df": stage_build_master_df,
+    "run_stationarity_suite": stage_run_stationarity_suite,
+    "analyze_seasonality": stage_analyze_seasonality,
+    "rolling_pca": stage_rolling_pca,
+    "render_diagnostics": stage_render_diagnostics,
+}
+
+
+def parse_size(size: str) -> tuple[int, int, int]:
+    try:
+        n_markets, n_tenors, n_years = (int(x) for x in size.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"Bad size '{size}': expected MARKETSxTENORSxYEARS, e.g. 8x4x10")
+    return n_markets, n_tenors, n_years
+
+
+def measure(fn, ctx, repeats=REPEATS) -> dict:
+    """
+    Best-of-N wall time; peak traced memory from a separate run so that
+    tracemalloc overhead does not leak into the timing.
+    """
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(ctx)
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        fn(ctx)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": min(times), "peak_mb": peak / 2**20}
+
+
+def run_size(size: str, stages=None, repeats=REPEATS, seed=SEED) -> list[dict]:
+    n_markets, n_tenors, n_years = parse_size(size)
+    stages = stages or list(STAGES)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_dir = write_synthetic_raw(Path(tmp) / "raw", n_markets, n_tenors, n_years, seed=seed)
+        master = build_master_df(raw_dir)
+        ctx = {
+            "raw_dir": raw_dir,
+            "master": master,
+            "tenor": _first_tenor(master),
+        }
+
+        for name in stages:
+            res = measure(STAGES[name], ctx, repeats=repeats)
+            rows.append({
+                "stage": name,
+                "size": size,
+                "n_markets": n_markets,
+                "n_tenors": n_tenors,
+                "n_years": n_years,
+                "n_rows": len(master),
+                "n_cols": master.shape[1],
+                "seconds": round(res["seconds"], 4),
+                "peak_mb": round(res["peak_mb"], 2),
+            })
+            print(f"{size:>10}  {name:<24} {res['seconds']:8.3f}s  {res['peak_mb']:8.1f} MB")
+
+    return rows
+
+
+def _first_tenor(master: pd.DataFrame) -> str:
+    # 'bond_yields__GTUSD2Y Govt' -> '2Y'
+    ticker = _yield_cols(master)[0].split("__", 1)[1].split()[0]
+    return ticker[5:]
+
+
+def run_benchmarks(sizes=SIZES, stages=None, repeats=REPEATS, seed=SEED) -> pd.DataFrame:
+    rows = []
+    for size in sizes:
+        rows.extend(run_size(size, stages=stages, repeats=repeats, seed=seed))
+    return pd.DataFrame(rows)
+
+
+def compare_to_baseline(res: pd.DataFrame, baseline: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ratio of current vs baseline time/memory per (stage, size).
+    'regressed' is True when either ratio exceeds its tolerance.
+    """
+    keys = ["stage", "size"]
+    merged = res.merge(
+        baseline[keys + ["seconds", "peak_mb"]],
+        on=keys,
+        suffixes=("", "_baseline"),
+    )
+    merged["time_ratio"] = merged["seconds"] / merged["seconds_baseline"]
+    merged["mem_ratio"] = merged["peak_mb"] / merged["peak_mb_baseline"]
+    merged["regressed"] = (merged["time_ratio"] > TIME_TOLERANCE) | (merged["mem_ratio"] > MEM_TOLERANCE)
+    return merged[keys + ["seconds", "seconds_baseline", "time_ratio", "peak_mb", "peak_mb_baseline", "mem_ratio", "regressed"]]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark pipeline stages on synthetic Bloomberg panels.")
+    ap.add_argument("--sizes", nargs="+", default=SIZES, help="MARKETSxTENORSxYEARS, e.g. 8x4x10")
+    ap.add_argument("--stages", nargs="+", default=None, choices=list(STAGES))
+    ap.add_argument("--repeats", type=int, default=REPEATS)
+    ap.add_argument("--seed", type=int, default=SEED)
+    ap.add_argument("--out", type=Path, default=OUT)
+    ap.add_argument("--compare", action="store_true",
+                    help="Compare against --out instead of overwriting it")
+    args = ap.parse_args()
+
+    res = run_benchmarks(args.sizes, stages=args.stages, repeats=args.repeats, seed=args.seed)
+
+    if args.compare:
+        if not args.out.exists():
+            raise FileNotFoundError(f"Missing {args.out}. Run without --compare first.")
+        cmp = compare_to_baseline(res, pd.read_csv(args.out))
+        print(cmp.to_string(index=False))
+        if cmp["regressed"].any():
+            raise SystemExit("Benchmark regression vs baseline:\n"
+                             + "\n".join(cmp.loc[cmp["regressed"], "stage"] + " @ " + cmp.loc[cmp["regressed"], "size"]))
+        return
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    res.to_csv(args.out, index=False)
+    print("Saved:", args.out)
+
+
+if __name__ == "__main__":
+    main()
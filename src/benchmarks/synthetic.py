@@ -0,0 +1,224 @@
+"""
+Purpose:
+--------
+Deterministic synthetic Bloomberg-format panel generator.
+
+Why this exists:
+----------------
+The raw Bloomberg exports are not tracked in Git (see DATA/README.md), so the
+pipeline cannot be exercised or timed offline. This module writes a full set of
+raw CSVs with the same file names and layout as DATA/raw, sized by
+markets x tenors x years, so that load_all_raw / build_master_df and every
+downstream stage run unchanged against it.
+
+The panel is built to look like the real data where it matters statistically:
+1) Yield levels are I(1) but cointegrated across markets within a tenor
+   (common stochastic trend + market-specific AR(1) deviation)
+2) Shock volatility follows a two-state Markov regime (calm / stressed),
+   which also drives MOVE and FX implied vol
+3) Holiday gaps: common closures (25 Dec, 1 Jan) are dropped from the
+   calendar, and each market has idiosyncratic missing days
+
+Same (n_markets, n_tenors, n_years, seed) -> identical files.
+"""
+
+import csv
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+from src.data.load_raw import RAW_FILES
+
+MARKETS = [
+    "USD", "EUR", "JPY", "CNY", "AUD", "KRW", "SGD", "GBP",
+    "CAD", "NZD", "CHF", "SEK", "NOK", "HKD", "INR", "THB",
+]
+TENORS = ["2Y", "5Y", "10Y", "30Y", "1Y", "7Y", "20Y", "3Y"]
+TENOR_YEARS = {"1Y": 1, "2Y": 2, "3Y": 3, "5Y": 5, "7Y": 7, "10Y": 10, "20Y": 20, "30Y": 30}
+
+START = "2005-01-03"
+DAYS_PER_YEAR = 252
+
+# Daily shock scale (yield points) in each regime, and regime persistence
+CALM_VOL = 0.04
+STRESS_VOL = 0.12
+P_STAY_CALM = 0.995
+P_STAY_STRESS = 0.98
+
+HOLIDAY_RATE = 0.02
+
+
+def business_calendar(n_years: int) -> pd.DatetimeIndex:
+    dates = pd.bdate_range(START, periods=n_years * DAYS_PER_YEAR)
+    closed = ((dates.month == 12) & (dates.day == 25)) | ((dates.month == 1) & (dates.day == 1))
+    return dates[~closed]
+
+
+def markov_regimes(n: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Two-state Markov chain: 0 = calm, 1 = stressed.
+    """
+    u = rng.random(n)
+    state = np.zeros(n, dtype=int)
+    for t in range(1, n):
+        stay = P_STAY_CALM if state[t - 1] == 0 else P_STAY_STRESS
+        state[t] = state[t - 1] if u[t] < stay else 1 - state[t - 1]
+    return state
+
+
+def _ar1(shocks: np.ndarray, phi: float) -> np.ndarray:
+    return lfilter([1.0], [1.0, -phi], shocks)
+
+
+def _punch_holidays(df: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    # Each column (market) misses its own days; shared closures are already off the calendar
+    mask = rng.random(df.shape) < HOLIDAY_RATE
+    return df.mask(mask)
+
+
+def make_yield_panel(
+    n_markets: int,
+    n_tenors: int,
+    n_years: int,
+    seed: int = 0,
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """
+    Returns (yields, regimes). Columns follow the Bloomberg ticker format,
+    e.g. 'GTJPY5Y Govt'. Within each tenor, all markets share one stochastic
+    trend, so any pair of markets is cointegrated in levels.
+    """
+    if not 1 <= n_markets <= len(MARKETS):
+        raise ValueError(f"n_markets must be in [1, {len(MARKETS)}]")
+    if not 1 <= n_tenors <= len(TENORS):
+        raise ValueError(f"n_tenors must be in [1, {len(TENORS)}]")
+    if n_years < 1:
+        raise ValueError("n_years must be >= 1")
+
+    rng = np.random.default_rng(seed)
+    dates = business_calendar(n_years)
+    n = len(dates)
+
+    regimes = markov_regimes(n, rng)
+    vol = np.where(regimes == 1, STRESS_VOL, CALM_VOL)
+
+    level = np.cumsum(rng.standard_normal(n) * vol)
+
+    cols = {}
+    for tenor in TENORS[:n_tenors]:
+        term = np.log1p(TENOR_YEARS[tenor])
+        trend = level + 0.3 * np.cumsum(rng.standard_normal(n) * vol)
+
+        for ccy in MARKETS[:n_markets]:
+            base = rng.uniform(0.5, 4.0) + 0.4 * term
+            beta = rng.uniform(0.6, 1.4)
+            phi = rng.uniform(0.90, 0.98)
+            dev = _ar1(rng.standard_normal(n) * vol, phi)
+            cols[f"GT{ccy}{tenor} Govt"] = base + beta * trend + dev
+
+    yields = pd.DataFrame(cols, index=dates)
+    return _punch_holidays(yields, rng), regimes
+
+
+def make_raw_panel(
+    n_markets: int,
+    n_tenors: int,
+    n_years: int,
+    seed: int = 0,
+) -> dict[str, pd.DataFrame]:
+    """
+    Full set of raw datasets keyed like load_all_raw().
+    """
+    yields, regimes = make_yield_panel(n_markets, n_tenors, n_years, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+
+    dates = yields.index
+    n = len(dates)
+    markets = MARKETS[:n_markets]
+    stressed = regimes == 1
+    vol = np.where(stressed, STRESS_VOL, CALM_VOL)
+
+    def rw(scale, start):
+        return start + np.cumsum(rng.standard_normal(n) * scale)
+
+    # Policy rates move in 25bp steps on rare meeting days
+    policy = {}
+    for ccy in markets:
+        moves = rng.choice([-0.25, 0.0, 0.25], size=n, p=[0.004, 0.992, 0.004])
+        policy[f"{ccy} Policy Rate"] = np.clip(rng.uniform(0.0, 4.0) + np.cumsum(moves), -0.75, None)
+
+    cesi = {
+        f"CESI{ccy} Index": 40 * np.sqrt(1 - 0.97 ** 2) * _ar1(rng.standard_normal(n), 0.97)
+        for ccy in markets
+    }
+
+    move = 70 + 60 * _ar1(stressed.astype(float) * 0.05, 0.95) + 5 * _ar1(rng.standard_normal(n) * 0.2, 0.99)
+
+    repo = {
+        "SOFRRATE Index": np.clip(rw(0.01, 2.0), 0.0, None),
+        "ESTRON Index": np.clip(rw(0.01, 1.0), -0.6, None),
+    }
+
+    us_eq = {
+        "SPX Index": 1200 * np.exp(np.cumsum(rng.standard_normal(n) * vol / 4 + 0.0003)),
+        "VIX Index": 15 + 150 * _ar1(stressed.astype(float) * 0.02, 0.95) + 2 * _ar1(rng.standard_normal(n) * 0.3, 0.98),
+    }
+
+    fx_1m = {
+        f"{ccy}1M Curncy": np.exp(np.cumsum(rng.standard_normal(n) * vol / 8)) * rng.uniform(0.5, 150)
+        for ccy in markets
+    }
+    fx_ov_iv = {
+        f"{ccy}V1D Curncy": np.abs(6 + 40 * _ar1(stressed.astype(float) * 0.03, 0.9) + _ar1(rng.standard_normal(n) * 0.5, 0.9))
+        for ccy in markets
+    }
+
+    frames = {
+        "bond_yields": yields,
+        "policyrates": pd.DataFrame(policy, index=dates),
+        "cesi": pd.DataFrame(cesi, index=dates),
+        "move": pd.DataFrame({"MOVE Index": move}, index=dates),
+        "dxy": pd.DataFrame({"BBDXY Index": 1000 * np.exp(rw(0.003, 0.0))}, index=dates),
+        "repo": pd.DataFrame(repo, index=dates),
+        "us_eq": pd.DataFrame(us_eq, index=dates),
+        "fx_1m": pd.DataFrame(fx_1m, index=dates),
+        "fx_ov_iv": pd.DataFrame(fx_ov_iv, index=dates),
+    }
+
+    for k in frames:
+        if k != "bond_yields":
+            frames[k] = _punch_holidays(frames[k], rng)
+    return frames
+
+
+def write_bbg_csv(df: pd.DataFrame, path: Path) -> None:
+    """
+    Inverse of src.data.load_raw._read_bbg_csv: ticker header, two
+    metadata rows (field, date), then data.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow([""] + list(df.columns))
+        w.writerow(["Field"] + ["PX_LAST"] * df.shape[1])
+        w.writerow(["Dates"] + [""] * df.shape[1])
+        df.to_csv(f, header=False, date_format="%Y-%m-%d", float_format="%.6f")
+
+
+def write_synthetic_raw(
+    raw_dir: Path,
+    n_markets: int,
+    n_tenors: int,
+    n_years: int,
+    seed: int = 0,
+) -> Path:
+    """
+    Write a synthetic DATA/raw-style directory readable by load_all_raw(raw_dir).
+    """
+    raw_dir = Path(raw_dir)
+    frames = make_raw_panel(n_markets, n_tenors, n_years, seed=seed)
+    for k, fname in RAW_FILES.items():
+        write_bbg_csv(frames[k], raw_dir / fname)
+    return raw_dir
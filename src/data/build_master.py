@@ -3,12 +3,12 @@ Function to output data to DATA/processed
 '''
 
 from pathlib import Path
-from src.data.load_raw import load_all_raw
+from src.data.load_raw import RAW_DIR, load_all_raw
 
 OUT_PATH = Path("DATA/processed/master_df.parquet")
 
-def build_master_df():
-    dfs = load_all_raw()
+def build_master_df(raw_dir: Path = RAW_DIR):
+    dfs = load_all_raw(raw_dir)
 
     master = None
     for name, df in dfs.items():
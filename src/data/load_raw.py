@@ -30,22 +30,22 @@ def _read_bbg_csv(path: Path) -> pd.DataFrame:
 
     return df
 
-def load_all_raw() -> dict[str, pd.DataFrame]:
-    files = {
-        "bond_yields": "bond_yields.csv",
-        "policyrates": "policyrates.csv",
-        "cesi": "citi_economic_surprise_index.csv",
-        "move": "OCE BofA MOVE INDEX.csv",
-        "dxy": "BBDXY.csv",
-        "repo": "repo.csv",
-        "us_eq": "us_equity_indicies.csv",
-        "fx_1m": "currency_1M_outright_normalizedtousdbaseccy.csv",
-        "fx_ov_iv": "currency_Overnight_ATM_Implied_Vol.csv",
-    }
-
+RAW_FILES = {
+    "bond_yields": "bond_yields.csv",
+    "policyrates": "policyrates.csv",
+    "cesi": "citi_economic_surprise_index.csv",
+    "move": "OCE BofA MOVE INDEX.csv",
+    "dxy": "BBDXY.csv",
+    "repo": "repo.csv",
+    "us_eq": "us_equity_indicies.csv",
+    "fx_1m": "currency_1M_outright_normalizedtousdbaseccy.csv",
+    "fx_ov_iv": "currency_Overnight_ATM_Implied_Vol.csv",
+}
+
+def load_all_raw(raw_dir: Path = RAW_DIR) -> dict[str, pd.DataFrame]:
     out = {}
-    for k, fname in files.items():
-        path = RAW_DIR / fname
+    for k, fname in RAW_FILES.items():
+        path = Path(raw_dir) / fname
         if not path.exists():
             raise FileNotFoundError(f"Missing file: {path}")
         out[k] = _read_bbg_csv(path)
@@ -5,83 +5,102 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
-def plot_structural_check(df, columns, title_prefix, window=60):
-    # Plots of drift, difference (Stationarity), and 60d rolling vol
+def structural_series(df, columns, window=60, log_returns=False):
+    """
+    Levels, daily changes and rolling vol for all columns in one pass.
+
+    Changes are taken between consecutive valid observations and the rolling
+    window counts observations (not calendar rows), i.e. the same numbers the
+    per-column dropna() -> diff() -> rolling() loop produces.
+
+    log_returns=True uses 100 * log(x_t / x_{t-1}) (equity indices).
+    """
+    levels = df[list(columns)]
+    prev = levels.ffill().shift(1)
+
+    if log_returns:
+        changes = 100 * np.log(levels / prev)
+    else:
+        changes = levels - prev
+
+    # Long format over valid levels only (a NaN change on a valid day still
+    # counts towards the window), one column after another
+    valid = levels.notna().to_numpy().T
+    col_pos, row_pos = np.nonzero(valid)
+    long = pd.Series(
+        changes.to_numpy().T[valid],
+        index=pd.MultiIndex.from_arrays([col_pos, row_pos]),
+    )
+    rolled = long.groupby(level=0).rolling(window=window).std().droplevel(0)
+
+    out = np.full(levels.shape, np.nan)
+    out[rolled.index.get_level_values(1), rolled.index.get_level_values(0)] = rolled.to_numpy()
+    vol = pd.DataFrame(out, index=levels.index, columns=levels.columns)
+    return levels, changes, vol
+
+def draw_structural_check(fig, axes, col, title_prefix, level, diff, vol, window=60):
+    # Draws onto existing fig/axes so batch rendering can reuse them
+    fig.suptitle(f"{title_prefix}: {col}", fontsize = 16)
+
+    if axes[0].lines:
+        # Already drawn once: swap the data in place. Much cheaper than
+        # cla() + re-plot, which rebuilds every tick and text artist
+        axes[0].lines[0].set_data(level.index, level)
+        axes[1].lines[0].set_data(level.index, diff)
+        axes[2].lines[0].set_data(level.index, vol)
+        for c in list(axes[2].collections):
+            c.remove()
+        axes[2].fill_between(level.index, vol, color='#d62728', alpha=0.1)
+        axes[2].set_ylabel(f"{window}D Vol")
+        for ax in axes:
+            ax.relim()
+            ax.autoscale_view()
+        return
+
+    #1st plot - Drift
+    axes[0].plot(level.index, level, color = 'blue', lw = 1.5)
+    axes[0].set_ylabel('Levels')
+    axes[0].set_title(f"Level Inspection (Drift)")
+    axes[0].grid(True)
+
+    #2nd plot - Difference
+    axes[1].plot(level.index, diff, color='#2ca02c', alpha=0.7, lw=1)
+    axes[1].axhline(0, color='black', linestyle='--', lw=0.8, alpha=0.5)
+    axes[1].set_ylabel("Daily Change")
+    axes[1].set_title("Stability Inspection (Stationarity)", fontsize=10, fontweight='bold')
+    axes[1].grid(True, alpha=0.3)
+
+    #3rd plot - Rolling vol (visualize regime clusters)
+    axes[2].plot(level.index, vol, color='#d62728', lw=1.5)
+    axes[2].fill_between(level.index, vol, color='#d62728', alpha=0.1)
+    axes[2].set_ylabel(f"{window}D Vol")
+    axes[2].set_title("Volatility Clustering (Regimes)", fontsize=10, fontweight='bold')
+    axes[2].grid(True, alpha=0.3)
+
+def _plot_structural(df, columns, title_prefix, window, log_returns):
+    levels, changes, vol = structural_series(df, columns, window=window, log_returns=log_returns)
 
     for col in columns:
-        plot_data = df[[col]].dropna().copy()
+        level = levels[col].dropna()
 
-        if plot_data.empty:
+        if level.empty:
             print(f"skipping {col}: no valid plot_data after dropping NaNs")
             continue
-        
+
         fig,axes = plt.subplots(3,1, figsize = (12, 10), sharex = True)
-        fig.suptitle(f"{title_prefix}: {col}", fontsize = 16)
-
-        #1st plot - Drift
-        axes[0].plot(plot_data.index, plot_data[col], color = 'blue', lw = 1.5)
-        axes[0].set_ylabel('Levels')
-        axes[0].set_title(f"Level Inspection (Drift)")
-        axes[0].grid(True)
-
-        #2nd plot - Difference
-        diff = plot_data[col].diff()
-        axes[1].plot(plot_data.index, diff, color='#2ca02c', alpha=0.7, lw=1)
-        axes[1].axhline(0, color='black', linestyle='--', lw=0.8, alpha=0.5) 
-        axes[1].set_ylabel("Daily Change")
-        axes[1].set_title("Stability Inspection (Stationarity)", fontsize=10, fontweight='bold')
-        axes[1].grid(True, alpha=0.3)
-
-        #3rd plot - Rolling vol (visualize regime clusters)
-        vol = diff.rolling(window=window).std()
-        
-        axes[2].plot(plot_data.index, vol, color='#d62728', lw=1.5)
-        axes[2].fill_between(plot_data.index, vol, color='#d62728', alpha=0.1)
-        axes[2].set_ylabel(f"{window}D Vol")
-        axes[2].set_title("Volatility Clustering (Regimes)", fontsize=10, fontweight='bold')
-        axes[2].grid(True, alpha=0.3)
+        draw_structural_check(
+            fig, axes, col, title_prefix,
+            level, changes[col].reindex(level.index), vol[col].reindex(level.index),
+            window=window,
+        )
 
         plt.tight_layout(rect=[0, 0, 1, 0.96])
         plt.show()
 
-
+def plot_structural_check(df, columns, title_prefix, window=60):
+    # Plots of drift, difference (Stationarity), and 60d rolling vol
+    _plot_structural(df, columns, title_prefix, window, log_returns=False)
 
 def plot_structural_check_eq(df, columns, title_prefix, window=60):
     # for plotting of us_eq_indices, log returns used
-
-    for col in columns:
-        plot_data = df[[col]].dropna().copy()
-
-        if plot_data.empty:
-            print(f"skipping {col}: no valid plot_data after dropping NaNs")
-            continue
-        
-        fig,axes = plt.subplots(3,1, figsize = (12, 10), sharex = True)
-        fig.suptitle(f"{title_prefix}: {col}", fontsize = 16)
-
-        #1st plot - Drift
-        axes[0].plot(plot_data.index, plot_data[col], color = 'blue', lw = 1.5)
-        axes[0].set_ylabel('Levels')
-        axes[0].set_title(f"Level Inspection (Drift)")
-        axes[0].grid(True)
-
-        #2nd plot - Difference
-        diff = 100 * np.log(plot_data[col] / plot_data[col].shift(1))
-        axes[1].plot(plot_data.index, diff, color='#2ca02c', alpha=0.7, lw=1)
-        axes[1].axhline(0, color='black', linestyle='--', lw=0.8, alpha=0.5) 
-        axes[1].set_ylabel("Daily Change")
-        axes[1].set_title("Stability Inspection (Stationarity)", fontsize=10, fontweight='bold')
-        axes[1].grid(True, alpha=0.3)
-
-        #3rd plot - Rolling vol (visualize regime clusters)
-        vol = diff.rolling(window=window).std()
-        
-        axes[2].plot(plot_data.index, vol, color='#d62728', lw=1.5)
-        
-        axes[2].fill_between(plot_data.index, vol, color='#d62728', alpha=0.1)
-        axes[2].set_ylabel(f"{window}D Vol")
-        axes[2].set_title("Volatility Clustering (Regimes)", fontsize=10, fontweight='bold')
-        axes[2].grid(True, alpha=0.3)
-
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
-        plt.show()
\ No newline at end of file
+    _plot_structural(df, columns, title_prefix, window, log_returns=True)
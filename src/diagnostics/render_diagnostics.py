@@ -0,0 +1,228 @@
+"""
+Purpose:
+--------
+Render the full visual diagnostic pack (structural checks + seasonality
+heatmaps) headlessly, in one unattended command.
+
+Why this exists:
+----------------
+plot_structural_check / plot_structural_check_eq / plot_seasonality_heatmap are
+interactive: one new figure per column, blocking on plt.show(). This script:
+1) Precomputes changes, rolling vol and year x month vol for all selected
+   columns in one vectorized pass
+2) Renders on the Agg backend, reusing one figure/axes set per worker
+3) Spreads the pages across a process pool
+
+This script generates (under results/diagnostics/):
+- png: one image per page, named {group}__{column}.png
+- pdf: one multi-page PDF per group, {group}.pdf
+
+Usage:
+    python -m src.diagnostics.render_diagnostics
+    python -m src.diagnostics.render_diagnostics --format pdf --workers 4
+"""
+
+import matplotlib
+matplotlib.use("Agg")
+
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import pandas as pd
+from matplotlib.backends.backend_pdf import PdfPages
+
+from src.diagnostics.plotting import draw_structural_check, structural_series
+from src.diagnostics.run_seasonality import FILTERS
+from src.diagnostics.seasonality import draw_seasonality_heatmap, monthly_vol_pivots
+
+MASTER = Path("DATA/processed/master_df.parquet")
+OUT_DIR = Path("results/diagnostics")
+
+WINDOW = 60
+DPI = 100
+
+# group: (title, dataset prefix(es), log returns?)
+STRUCTURAL_GROUPS = {
+    "yields": ("Bond Yields", ("bond_yields",), False),
+    "policy": ("Policy Rates", ("policyrates",), False),
+    "macro": ("Economic Surprise", ("cesi",), False),
+    "funding": ("Funding", ("repo",), False),
+    "stress": ("Stress Indicators", ("move", "dxy", "fx_ov_iv"), False),
+    "fx": ("FX 1M Outright", ("fx_1m",), False),
+    "us_eq": ("US Equity", ("us_eq",), True),
+}
+
+
+def _slug(s: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", s).strip("_")
+
+
+def structural_pages(df: pd.DataFrame, window=WINDOW) -> list[dict]:
+    pages = []
+    for group, (title, datasets, log_returns) in STRUCTURAL_GROUPS.items():
+        cols = [c for c in df.columns if c.split("__", 1)[0] in datasets]
+        if not cols:
+            continue
+
+        levels, changes, vol = structural_series(df, cols, window=window, log_returns=log_returns)
+
+        for col in cols:
+            level = levels[col].dropna()
+            if level.empty:
+                print(f"skipping {col}: no valid plot_data after dropping NaNs")
+                continue
+            pages.append({
+                "kind": "structural",
+                "group": group,
+                "col": col,
+                "title": title,
+                "window": window,
+                "level": level,
+                "diff": changes[col].reindex(level.index),
+                "vol": vol[col].reindex(level.index),
+            })
+    return pages
+
+
+def seasonality_pages(df: pd.DataFrame) -> list[dict]:
+    df_diff = df.diff()
+
+    pages = []
+    for grp, pred in FILTERS.items():
+        cols = [c for c in df_diff.columns if pred(c)]
+        if not cols:
+            continue
+
+        for col, pivot in monthly_vol_pivots(df_diff, cols).items():
+            if pivot.empty or pivot.isnull().all().all():
+                print(f"Skipping {col}: insufficient data")
+                continue
+            pages.append({
+                "kind": "seasonality",
+                "group": f"seasonality_{grp}",
+                "col": col,
+                "title": grp,
+                "pivot": pivot,
+            })
+    return pages
+
+
+def _render_pages(pages: list[dict], out_dir: Path, fmt: str) -> list[Path]:
+    """
+    Worker: draws every page onto one reused figure per plot kind.
+    png -> one file per page; pdf -> all pages into out_dir/{group}.pdf
+    (pdf tasks always hold a single group).
+    """
+    figs = {}
+
+    def get_fig(kind):
+        if kind not in figs:
+            if kind == "structural":
+                fig, axes = plt.subplots(3, 1, figsize=(12, 10), sharex=True)
+                fig.subplots_adjust(left=0.08, right=0.97, bottom=0.05, top=0.91, hspace=0.3)
+                figs[kind] = (fig, axes)
+            else:
+                fig = plt.figure(figsize=(10, 6))
+                ax = fig.add_axes([0.08, 0.1, 0.72, 0.8])
+                cbar_ax = fig.add_axes([0.84, 0.1, 0.03, 0.8])
+                figs[kind] = (fig, (ax, cbar_ax))
+        return figs[kind]
+
+    def draw(page):
+        fig, axes = get_fig(page["kind"])
+        if page["kind"] == "structural":
+            draw_structural_check(
+                fig, axes, page["col"], page["title"],
+                page["level"], page["diff"], page["vol"], window=page["window"],
+            )
+        else:
+            ax, cbar_ax = axes
+            draw_seasonality_heatmap(fig, ax, cbar_ax, page["pivot"], page["title"], page["col"])
+        return fig
+
+    written = []
+    try:
+        if fmt == "pdf":
+            path = out_dir / f"{pages[0]['group']}.pdf"
+            with PdfPages(path) as pdf:
+                for page in pages:
+                    pdf.savefig(draw(page))
+            written.append(path)
+        else:
+            for page in pages:
+                path = out_dir / f"{page['group']}__{_slug(page['col'])}.png"
+                draw(page).savefig(path, dpi=DPI)
+                written.append(path)
+    finally:
+        for fig, _ in figs.values():
+            plt.close(fig)
+
+    return written
+
+
+def _chunk(pages: list[dict], n: int) -> list[list[dict]]:
+    # Round-robin so heavy groups (e.g. yields) are spread over all workers
+    chunks = [pages[i::n] for i in range(n)]
+    return [c for c in chunks if c]
+
+
+def render_diagnostics(
+    df: pd.DataFrame,
+    out_dir: Path = OUT_DIR,
+    fmt: str = "png",
+    workers: int | None = None,
+    window: int = WINDOW,
+) -> list[Path]:
+    if fmt not in ("png", "pdf"):
+        raise ValueError(f"Unknown format: {fmt}")
+
+    pages = structural_pages(df, window=window) + seasonality_pages(df)
+    if not pages:
+        return []
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if fmt == "pdf":
+        # One task per group so each PDF is written by a single process
+        tasks = {}
+        for page in pages:
+            tasks.setdefault(page["group"], []).append(page)
+        tasks = list(tasks.values())
+    else:
+        tasks = _chunk(pages, workers or os.cpu_count() or 1)
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers == 1:
+        results = [_render_pages(t, out_dir, fmt) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_render_pages, tasks, [out_dir] * len(tasks), [fmt] * len(tasks)))
+
+    return sorted(p for r in results for p in r)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Render the diagnostic plot pack headlessly.")
+    ap.add_argument("--format", choices=["png", "pdf"], default="png")
+    ap.add_argument("--workers", type=int, default=None, help="Default: all CPUs")
+    ap.add_argument("--window", type=int, default=WINDOW)
+    ap.add_argument("--out", type=Path, default=OUT_DIR)
+    args = ap.parse_args()
+
+    if not MASTER.exists():
+        raise FileNotFoundError("Missing DATA/processed/master_df.parquet. Run build_master first.")
+
+    df = pd.read_parquet(MASTER).sort_index()
+    written = render_diagnostics(df, out_dir=args.out, fmt=args.format,
+                                 workers=args.workers, window=args.window)
+
+    print("Saved:", len(written), "files to", args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -110,6 +110,33 @@ def analyze_seasonality(series: pd.Series, name="Asset"):
         "monthly_vol": monthly_vol,
     }
 
+def monthly_vol_pivots(df_changes: pd.DataFrame, columns) -> dict[str, pd.DataFrame]:
+    """
+    Year x month std of changes for every column, from a single groupby.
+    """
+    sub = df_changes[list(columns)]
+    stds = sub.groupby([sub.index.year, sub.index.month]).std()
+    stds.index.names = ["year", "month"]
+
+    pivots = {}
+    for col in stds.columns:
+        pivot = stds[col].unstack("month").dropna(how="all").dropna(axis=1, how="all")
+        pivot.columns.name = "month"
+        pivots[col] = pivot
+    return pivots
+
+def draw_seasonality_heatmap(fig, ax, cbar_ax, pivot: pd.DataFrame, title: str, col: str):
+    # Draws onto existing axes so batch rendering can reuse them
+    ax.cla()
+    if cbar_ax is not None:
+        cbar_ax.cla()
+
+    sns.heatmap(pivot, ax=ax, cbar_ax=cbar_ax, cmap="coolwarm", annot=False,
+                cbar_kws={"label": "Monthly Volatility"})
+    ax.set_title(f"Seasonality Heatmap: {title} ({col})")
+    ax.set_xlabel("Month")
+    ax.set_ylabel("Year")
+
 def plot_seasonality_heatmap(df_changes: pd.DataFrame, contains: str, title: str):
     cols = [c for c in df_changes.columns if contains in c.lower()]
     if not cols:
@@ -117,23 +144,16 @@ def plot_seasonality_heatmap(df_changes: pd.DataFrame, contains: str, title: str
         return
 
     col = cols[0]
-    s = df_changes[col].dropna()
-    if s.empty:
+    if df_changes[col].dropna().empty:
         print(f"Skipping {title}: no data")
         return
 
-    tmp = s.to_frame(col)
-    tmp["year"] = tmp.index.year
-    tmp["month"] = tmp.index.month
-    pivot = tmp.pivot_table(index="year", columns="month", values=col, aggfunc="std")
+    pivot = monthly_vol_pivots(df_changes, [col])[col]
 
     if pivot.empty or pivot.isnull().all().all():
         print(f"Skipping {title}: insufficient data")
         return
 
-    plt.figure(figsize=(10, 6))
-    sns.heatmap(pivot, cmap="coolwarm", annot=False, cbar_kws={"label": "Monthly Volatility"})
-    plt.title(f"Seasonality Heatmap: {title} ({col})")
-    plt.xlabel("Month")
-    plt.ylabel("Year")
+    fig, ax = plt.subplots(figsize=(10, 6))
+    draw_seasonality_heatmap(fig, ax, None, pivot, title, col)
     plt.show()
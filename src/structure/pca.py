@@ -0,0 +1,83 @@
+"""
+Purpose:
+--------
+PCA on yield changes, used to separate the common (directional) factor from
+true relative value. Mirrors the workflow in NOTEBOOKS/05_pca_structure.ipynb.
+
+PCA is only legal on I(0) inputs: pass yield *changes*, never levels
+(see docs/stationarity_decisions.md).
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import PCA
+
+
+def standardize(X: pd.DataFrame) -> pd.DataFrame:
+    return ((X - X.mean()) / X.std(ddof=0)).dropna(how="any")
+
+
+def fullsample_loadings(X: pd.DataFrame, n_components: int = 10) -> pd.DataFrame:
+    p = PCA(n_components=min(X.shape[1], n_components))
+    p.fit(X.values)
+    return pd.DataFrame(
+        p.components_.T,
+        index=X.columns,
+        columns=[f"PC{i+1}" for i in range(p.components_.shape[0])]
+    )
+
+
+def align_to_baseline(vec, baseline):
+    if np.dot(vec, baseline) < 0:
+        return -vec
+    return vec
+
+
+def rolling_pc1(X: pd.DataFrame, window: int = 252, baseline=None):
+    """
+    Rolling PC1 variance share, cosine similarity to the full-sample PC1 and
+    sign-aligned PC1 loadings.
+
+    Returns (metrics, loadings) indexed by the window end date.
+    """
+    if baseline is None:
+        baseline = fullsample_loadings(X)["PC1"].values
+    baseline = np.asarray(baseline, dtype=float)
+
+    pc1_var = []
+    pc1_cos = []
+    pc1_loadings_over_time = []
+    idx = []
+
+    Xv = X.values
+
+    for end in range(window, len(X)):
+        start = end - window
+        Xw = Xv[start:end, :]
+        if np.isnan(Xw).any():
+            continue
+
+        p = PCA(n_components=1)
+        p.fit(Xw)
+
+        vec = align_to_baseline(p.components_[0].copy(), baseline)
+        cos = float(
+            np.dot(vec, baseline)
+            / (np.linalg.norm(vec) * np.linalg.norm(baseline))
+        )
+
+        pc1_var.append(float(p.explained_variance_ratio_[0]))
+        pc1_cos.append(cos)
+        pc1_loadings_over_time.append(vec)
+        idx.append(X.index[end])
+
+    metrics = pd.DataFrame(
+        {"pc1_var": pc1_var, "pc1_cosine_to_fullsample": pc1_cos},
+        index=pd.to_datetime(idx)
+    )
+    loadings = pd.DataFrame(
+        pc1_loadings_over_time,
+        index=metrics.index,
+        columns=X.columns.tolist()
+    )
+    return metrics, loadings
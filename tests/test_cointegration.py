@@ -0,0 +1,12 @@
+from statsmodels.tsa.stattools import coint
+
+from src.benchmarks.synthetic import make_yield_panel
+
+
+def test_same_tenor_pairs_cointegrated():
+    y, _ = make_yield_panel(3, 1, 8, seed=2)
+    y = y.dropna()
+    a, b, c = y.columns
+
+    assert coint(y[a], y[b])[1] < 0.05
+    assert coint(y[a], y[c])[1] < 0.05
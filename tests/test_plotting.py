@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from src.benchmarks.synthetic import make_raw_panel, write_synthetic_raw
+from src.data.build_master import build_master_df
+from src.diagnostics.plotting import structural_series
+from src.diagnostics.render_diagnostics import render_diagnostics
+
+
+def test_structural_series_matches_per_column_loop():
+    df = make_raw_panel(3, 1, 2, seed=0)["us_eq"]
+    cols = list(df.columns)
+
+    for log_returns in (False, True):
+        _, changes, vol = structural_series(df, cols, window=20, log_returns=log_returns)
+
+        for col in cols:
+            s = df[col].dropna()
+            diff = 100 * np.log(s / s.shift(1)) if log_returns else s.diff()
+            pd.testing.assert_series_equal(changes[col].reindex(s.index), diff, check_freq=False)
+            pd.testing.assert_series_equal(
+                vol[col].reindex(s.index), diff.rolling(20).std(), check_freq=False
+            )
+
+
+def test_render_diagnostics_headless(tmp_path):
+    write_synthetic_raw(tmp_path / "raw", 2, 1, 2, seed=0)
+    df = build_master_df(tmp_path / "raw")
+
+    pngs = render_diagnostics(df, out_dir=tmp_path / "png", fmt="png", workers=1)
+    assert len(pngs) > df.shape[1]
+    assert all(p.suffix == ".png" and p.stat().st_size > 0 for p in pngs)
+
+    pdfs = render_diagnostics(df, out_dir=tmp_path / "pdf", fmt="pdf", workers=1)
+    assert {p.stem for p in pdfs} >= {"yields", "us_eq", "seasonality_yields"}
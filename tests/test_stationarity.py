@@ -0,0 +1,20 @@
+from src.benchmarks.synthetic import make_yield_panel
+from src.diagnostics.stationarity import run_stationarity_suite
+
+
+def test_yield_levels_trend_changes_stationary():
+    y, _ = make_yield_panel(2, 1, 8, seed=1)
+
+    levels = run_stationarity_suite(y)
+    diffs = run_stationarity_suite(y.diff())
+
+    # Levels carry a stochastic trend: KPSS rejects stationarity
+    assert (levels["kpss_p"] < 0.05).all()
+    # Changes: ADF rejects the unit root
+    assert (diffs["adf_p"] < 0.01).all()
+
+
+def test_short_series_flagged_insufficient():
+    y, _ = make_yield_panel(1, 1, 1, seed=0)
+    res = run_stationarity_suite(y.iloc[:100])
+    assert res["label"].eq("Insufficient data / constant").all()
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from src.benchmarks.synthetic import make_yield_panel, write_synthetic_raw
+from src.data.build_master import build_master_df
+from src.data.load_raw import RAW_FILES, _read_bbg_csv, load_all_raw
+
+
+def test_panel_is_deterministic():
+    a, ra = make_yield_panel(3, 2, 2, seed=7)
+    b, rb = make_yield_panel(3, 2, 2, seed=7)
+    pd.testing.assert_frame_equal(a, b)
+    assert (ra == rb).all()
+
+
+def test_panel_shape_and_holidays():
+    y, regimes = make_yield_panel(4, 3, 8, seed=0)
+    assert y.shape[1] == 12
+    assert "GTJPY5Y Govt" in y.columns
+    assert not ((y.index.month == 12) & (y.index.day == 25)).any()
+    assert y.isna().any().all()
+    assert set(regimes) == {0, 1}
+
+
+def test_bbg_round_trip(tmp_path):
+    write_synthetic_raw(tmp_path, 3, 2, 2, seed=0)
+    df = _read_bbg_csv(tmp_path / RAW_FILES["bond_yields"])
+    y, _ = make_yield_panel(3, 2, 2, seed=0)
+
+    assert list(df.columns) == list(y.columns)
+    pd.testing.assert_frame_equal(df, y.rename_axis("date"), check_freq=False, atol=1e-6)
+
+    assert set(load_all_raw(tmp_path)) == set(RAW_FILES)
+    master = build_master_df(tmp_path)
+    assert "bond_yields__GTUSD2Y Govt" in master.columns